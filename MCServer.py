@@ -1,18 +1,65 @@
 import asyncio
+import base64
+import collections
+import io
 import os
+import select
+import shlex
+import signal
 import subprocess
+import time
 
 import discord
 import mctools.mclient
 from discord.ext import commands
 from dotenv import load_dotenv
+from mcstatus.pinger import AsyncServerPinger, PingResponse
+from mcstatus.protocol.connection import TCPAsyncSocketConnection, UDPAsyncSocketConnection
+from mcstatus.querier import AsyncServerQuerier, QueryResponse
 from mcstatus.server import MinecraftServer
 from mctools import RCONClient
+from mctools.errors import ProtoConnectionClosed, RCONCommunicationError, RCONError
+import socket
 from socket import gaierror
+from typing import NamedTuple, Optional
 
 REMOVE_FORMATTER = mctools.mclient.BaseClient.REMOVE
 
-load_dotenv("mc.env")
+
+class MCServerConfig(NamedTuple):
+    """
+        The settings for the minecraft server, read from the environment and mc.env
+    """
+
+    server_ip: str
+    public_ip: str
+    server_port: int
+    rcon_port: int
+    rcon_password: str
+    working_directory: str
+    exec_command: str
+    stop_timeout: int
+
+
+def _load_config() -> MCServerConfig:
+    """
+        Reads the minecraft server settings once, converting them to the types they're used as
+
+        :returns: The settings for the minecraft server
+        :rtype: MCServerConfig
+    """
+
+    load_dotenv("mc.env")
+    return MCServerConfig(
+        server_ip=os.getenv("MC_SERVER_IP", "127.0.0.1"),
+        public_ip=os.getenv("MC_PUBLIC_IP", "private"),
+        server_port=int(os.getenv("MC_SERVER_PORT", "25565")),
+        rcon_port=int(os.getenv("MC_RCON_PORT", "25575")),
+        rcon_password=os.getenv("MC_RCON_PASSWORD", ""),
+        working_directory=os.getenv("MC_SERVER_WORKING_DIRECTORY", "./"),
+        exec_command=os.getenv("MC_SERVER_EXEC_COMMAND", "./start.sh"),
+        stop_timeout=int(os.getenv("MC_SERVER_STOP_TIMEOUT", "5")),
+    )
 
 
 class MCServerError(Exception):
@@ -35,6 +82,8 @@ class MCServerControl(commands.Cog, name="Minecraft"):
     """
         This cog provides commands for controlling a minecraft server
 
+        :cvar CONFIG: The settings the other class variables are read from
+        :type CONFIG: MCServerConfig
         :cvar SERVER_IP: The ip address of the server
         :type SERVER_IP: str
         :cvar PUBLIC_IP: The ip address of the server people use to connect
@@ -49,25 +98,65 @@ class MCServerControl(commands.Cog, name="Minecraft"):
         :type SERVER_WORKING_DIRECTORY: str
         :cvar SERVER_EXEC_COMMAND: The command to use to start the server
         :type SERVER_EXEC_COMMAND: str
+        :cvar SERVER_EXEC_ARGV: SERVER_EXEC_COMMAND split into arguments, so it can be run without a shell
+        :type SERVER_EXEC_ARGV: list[str]
         :cvar SERVER_STOP_TIMEOUT: How long to wait before force-killing the server process
         :type SERVER_STOP_TIMEOUT: int
+        :cvar QUERY_CACHE_TTL: How many seconds a successful status or query result is reused for
+        :type QUERY_CACHE_TTL: float
+        :cvar QUERY_ERROR_CACHE_TTL: How many seconds a failed status or query result is reused for
+        :type QUERY_ERROR_CACHE_TTL: float
+        :cvar QUERY_ERRORS: The errors that mean the server can't be reached, these are handled and cached
+        :type QUERY_ERRORS: tuple[type, ...]
+        :cvar QUERY_TRIES: How many times to try a status or query exchange on one connection before giving up
+        :type QUERY_TRIES: int
+        :cvar SERVER_LOG_LINES: How many lines of server output to keep for mc-log
+        :type SERVER_LOG_LINES: int
         :ivar bot: The discord bot to install this cog to
         :type bot: commands.Bot
-        :ivar rcon: The Rcon connection object to use for remote execution of commands
+        :ivar rcon: The Rcon connection object to use for remote execution of commands, kept open between commands
         :type rcon: Optional[RCONClient]
+        :ivar rcon_queue: Commands waiting to be sent over the rcon connection, with the futures for their responses,
+            a command of None closes the connection
+        :type rcon_queue: asyncio.Queue[tuple[Optional[str], asyncio.Future]]
+        :ivar rcon_worker: The task that sends queued commands one at a time, started on first use
+        :type rcon_worker: Optional[asyncio.Task]
         :ivar query: The Query connection object to use for queries
         :type query: MinecraftServer
+        :ivar resolved_ip: The IP address query's host resolves to, looked up on first use
+        :type resolved_ip: Optional[str]
+        :ivar query_cache: The last result of each query type, as (timestamp, result, error)
+        :type query_cache: dict[str, tuple[float, object, Optional[BaseException]]]
+        :ivar query_locks: Locks that make concurrent queries of the same type share one request
+        :type query_locks: dict[str, asyncio.Lock]
+        :ivar favicon: The last favicon the server sent, as (data uri, decoded png)
+        :type favicon: Optional[tuple[str, bytes]]
+        :ivar public_address: The address people use to join the server
+        :type public_address: str
+        :ivar join_message: The response to mc-join
+        :type join_message: str
         :ivar server_proc: The process the server is running in
+        :ivar server_log: The most recent lines the server has printed
+        :type server_log: collections.deque[str]
+        :ivar log_reader: The task reading the server's output into server_log
+        :type log_reader: Optional[asyncio.Task]
     """
 
-    SERVER_IP = os.getenv("MC_SERVER_IP", "127.0.0.1")
-    PUBLIC_IP = os.getenv("MC_PUBLIC_IP", "private")
-    SERVER_PORT = os.getenv("MC_SERVER_PORT", 25565)
-    SERVER_RCON_PORT = os.getenv("MC_RCON_PORT", 25575)
-    SERVER_RCON_PASSWORD = os.getenv("MC_RCON_PASSWORD", "")
-    SERVER_WORKING_DIRECTORY = os.getenv("MC_SERVER_WORKING_DIRECTORY", "./")
-    SERVER_EXEC_COMMAND = os.getenv("MC_SERVER_EXEC_COMMAND", "./start.sh")
-    SERVER_STOP_TIMEOUT = int(os.getenv("MC_SERVER_STOP_TIMEOUT", "5"))
+    CONFIG = _load_config()
+    SERVER_IP = CONFIG.server_ip
+    PUBLIC_IP = CONFIG.public_ip
+    SERVER_PORT = CONFIG.server_port
+    SERVER_RCON_PORT = CONFIG.rcon_port
+    SERVER_RCON_PASSWORD = CONFIG.rcon_password
+    SERVER_WORKING_DIRECTORY = CONFIG.working_directory
+    SERVER_EXEC_COMMAND = CONFIG.exec_command
+    SERVER_EXEC_ARGV = shlex.split(SERVER_EXEC_COMMAND)
+    SERVER_STOP_TIMEOUT = CONFIG.stop_timeout
+    QUERY_CACHE_TTL = 3.0
+    QUERY_ERROR_CACHE_TTL = 1.0
+    QUERY_ERRORS = (ConnectionError, TimeoutError, asyncio.TimeoutError, gaierror)
+    QUERY_TRIES = 3
+    SERVER_LOG_LINES = 100
 
     def __init__(self, bot):
         """
@@ -79,29 +168,323 @@ class MCServerControl(commands.Cog, name="Minecraft"):
 
         self.bot: commands.Bot = bot
         self.rcon = None
+        self.rcon_queue = asyncio.Queue()
+        self.rcon_worker = None
         self.query = MinecraftServer.lookup(f"{self.SERVER_IP}:{self.SERVER_PORT}")
+        self.resolved_ip = None
+        self.query_cache = {}
+        self.query_locks = {"status": asyncio.Lock(), "query": asyncio.Lock()}
+        self.favicon = None
+        self.public_address = f"{self.PUBLIC_IP}:{self.SERVER_PORT}"
+        self.join_message = f"The server can be joined by typing `{self.public_address}` as the server address"
         self.server_proc = None
+        self.server_log = collections.deque(maxlen=self.SERVER_LOG_LINES)
+        self.log_reader = None
 
     async def _init_rcon(self) -> None:
         """
             Initializes an rcon connection to the minecraft server
         """
 
+        # Only keep the client once it's logged in, so a failed login can't leave an unauthenticated client behind
+        rcon = RCONClient(self.SERVER_IP, port=self.SERVER_RCON_PORT, format_method=REMOVE_FORMATTER)
         try:
-            self.rcon = RCONClient(self.SERVER_IP, port=self.SERVER_RCON_PORT, format_method=REMOVE_FORMATTER)
-            success = self.rcon.login(self.SERVER_RCON_PASSWORD)
-            if not success:
-                raise RCONFailedError("Invalid Authentication")
-        except ConnectionError or gaierror:
+            # RCON packets are tiny, so don't let Nagle's algorithm hold them back waiting for more data
+            rcon.proto.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            loop = asyncio.get_running_loop()
+            success = await loop.run_in_executor(None, rcon.login, self.SERVER_RCON_PASSWORD)
+        # rcon.proto.stop() is used for cleanup since it closes the socket even if it never connected
+        except (OSError, ProtoConnectionClosed):
+            rcon.proto.stop()
             raise RCONFailedError("Server refused rcon, is rcon enabled?")
+        except RCONError:
+            rcon.proto.stop()
+            raise RCONFailedError("Rcon login failed")
+        except BaseException:
+            rcon.proto.stop()
+            raise
+        if not success:
+            rcon.proto.stop()
+            raise RCONFailedError("Invalid Authentication")
+        self.rcon = rcon
+
+    def _stop_rcon(self) -> None:
+        """
+            Closes the connection to the rcon server, if there is one
+        """
 
-    async def _stop_rcon(self) -> None:
+        if self.rcon is not None:
+            self.rcon.stop()
+            self.rcon = None
+
+    def _rcon_alive(self) -> bool:
         """
-            Closes the connection to the rcon server
+            Checks whether the server has closed the rcon connection, without blocking or sending anything
+
+            :returns: Whether the connection is still open
+            :rtype: bool
         """
 
-        self.rcon.stop()
-        self.rcon = None
+        # An idle connection has nothing to read, so if it's readable the server either closed it, reset it or sent
+        # something nobody asked for, and it should be replaced in all of those cases
+        readable, _, _ = select.select([self.rcon.proto.sock], [], [], 0)
+        return len(readable) == 0
+
+    def cog_unload(self) -> None:
+        """
+            Stops the background tasks and closes the rcon connection when the cog is removed from the bot
+        """
+
+        # Nothing will send the queued commands now, so don't leave their callers waiting
+        while not self.rcon_queue.empty():
+            _, future = self.rcon_queue.get_nowait()
+            future.cancel()
+            self.rcon_queue.task_done()
+        if self.rcon_worker is not None and not self.rcon_worker.done():
+            # A command may still be running in the executor, so let the worker close the connection once it's done
+            # and only stop the worker after that
+            worker = self.rcon_worker
+            closed = worker.get_loop().create_future()
+            self.rcon_queue.put_nowait((None, closed))
+            closed.add_done_callback(lambda _: worker.cancel())
+        else:
+            self._stop_rcon()
+        self.rcon_worker = None
+        if self.log_reader is not None:
+            self.log_reader.cancel()
+            self.log_reader = None
+
+    async def _send_rcon_command(self, command: str) -> str:
+        """
+            Sends a command over the rcon connection, connecting or reconnecting first if needed
+
+            If the connection is lost after the command is sent the command isn't sent again, since the server may
+            have already run it
+
+            The rcon client is blocking, so calls to it are run in the default executor to keep the event loop free
+
+            :param command: The command to send
+            :type command: str
+            :returns: What the server says in response to the command
+            :rtype: str
+        """
+
+        loop = asyncio.get_running_loop()
+        if self.rcon is not None and not self._rcon_alive():
+            self._stop_rcon()
+        if self.rcon is None:
+            await self._init_rcon()
+        try:
+            return await loop.run_in_executor(None, self.rcon.command, command)
+        except socket.timeout:
+            self._stop_rcon()
+            raise RCONFailedError("Server didn't respond to rcon in time")
+        except (OSError, ProtoConnectionClosed, RCONError):
+            # The server may have already run the command, so it isn't sent again
+            self._stop_rcon()
+            raise RCONFailedError("Lost connection to rcon, is the server still running?")
+
+    async def _run_rcon_worker(self) -> None:
+        """
+            Sends queued rcon commands one at a time over the shared connection
+
+            A command of None closes the connection, so it's never closed while a command is using it
+        """
+
+        while True:
+            command, future = await self.rcon_queue.get()
+            try:
+                if future.done():
+                    continue
+                try:
+                    if command is None:
+                        self._stop_rcon()
+                        response = None
+                    else:
+                        response = await self._send_rcon_command(command)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except Exception as error:
+                    if not future.done():
+                        future.set_exception(error)
+                else:
+                    if not future.done():
+                        future.set_result(response)
+            finally:
+                self.rcon_queue.task_done()
+
+    async def _resolve_query(self) -> str:
+        """
+            Resolves the server's hostname once so status and query requests don't each do a DNS lookup
+
+            :returns: The IP address of the server
+            :rtype: str
+        """
+
+        if self.resolved_ip is None:
+            loop = asyncio.get_running_loop()
+            addresses = await loop.getaddrinfo(self.query.host, self.query.port, type=socket.SOCK_STREAM)
+            self.resolved_ip = addresses[0][4][0]
+        return self.resolved_ip
+
+    async def _retry_exchange(self, exchange):
+        """
+            Runs a status or query exchange on an open connection, trying again up to QUERY_TRIES times like mcstatus
+
+            Timeouts aren't retried, a server that didn't answer in time won't answer the next try either and every
+            other caller is waiting on the cache lock meanwhile
+
+            :param exchange: The coroutine function that talks to the server
+            :returns: The result of the exchange
+        """
+
+        for attempt in range(self.QUERY_TRIES):
+            try:
+                return await exchange()
+            except (TimeoutError, asyncio.TimeoutError):
+                raise
+            except self.QUERY_ERRORS:
+                if attempt == self.QUERY_TRIES - 1:
+                    raise
+
+    async def _fetch_status(self, ip: str) -> PingResponse:
+        """
+            Gets the status of the server over a connection to the given IP address
+
+            :param ip: The IP address of the server
+            :type ip: str
+            :returns: The status response of the server
+            :rtype: PingResponse
+        """
+
+        connection = TCPAsyncSocketConnection()
+        await connection.connect((ip, self.query.port))
+        # The handshake keeps the configured hostname, proxies with forced hosts route on it
+        pinger = AsyncServerPinger(connection, host=self.query.host, port=self.query.port)
+
+        async def ping():
+            pinger.handshake()
+            result = await pinger.read_status()
+            result.latency = await pinger.test_ping()
+            return result
+
+        try:
+            return await self._retry_exchange(ping)
+        finally:
+            connection.close()
+
+    async def _fetch_query(self, ip: str) -> QueryResponse:
+        """
+            Gets the full query of the server over a connection to the given IP address
+
+            :param ip: The IP address of the server
+            :type ip: str
+            :returns: The query response of the server
+            :rtype: QueryResponse
+        """
+
+        connection = UDPAsyncSocketConnection()
+        await connection.connect((ip, self.query.port))
+        querier = AsyncServerQuerier(connection)
+
+        async def query():
+            await querier.handshake()
+            return await querier.read_query()
+
+        try:
+            return await self._retry_exchange(query)
+        finally:
+            connection.stream.close()
+
+    async def _cached_query_result(self, kind: str, fetch):
+        """
+            Gets a status or query result, reusing a recent one if available
+
+            Concurrent callers wait on the same lock, so only one request is sent to the server per cache window.
+            Errors in QUERY_ERRORS are cached too (for a shorter time) and re-raised to every caller, other errors
+            are raised once and not cached.
+
+            :param kind: The name of the cache entry to use
+            :type kind: str
+            :param fetch: The coroutine function that gets a fresh result from the IP address it's passed
+            :returns: The result of the query
+        """
+
+        async with self.query_locks[kind]:
+            cached = self.query_cache.get(kind)
+            if cached is not None:
+                timestamp, result, error = cached
+                ttl = self.QUERY_CACHE_TTL if error is None else self.QUERY_ERROR_CACHE_TTL
+                if time.monotonic() - timestamp < ttl:
+                    if error is not None:
+                        raise error
+                    return result
+            try:
+                result = await fetch(await self._resolve_query())
+            except self.QUERY_ERRORS as error:
+                # The address may have changed, so look it up again next time
+                self.resolved_ip = None
+                self.query_cache[kind] = (time.monotonic(), None, error)
+                raise
+            self.query_cache[kind] = (time.monotonic(), result, None)
+            return result
+
+    async def _cached_status(self):
+        """
+            Gets the status of the server, cached for a few seconds
+
+            :returns: The status response of the server
+            :rtype: PingResponse
+        """
+
+        return await self._cached_query_result("status", self._fetch_status)
+
+    async def _cached_query(self):
+        """
+            Gets the full query of the server, cached for a few seconds
+
+            :returns: The query response of the server
+            :rtype: QueryResponse
+        """
+
+        return await self._cached_query_result("query", self._fetch_query)
+
+    def _favicon_file(self, favicon: Optional[str]) -> Optional[discord.File]:
+        """
+            Makes an attachable file from the favicon in a status response, only decoding it when it changes
+
+            :param favicon: The favicon data uri the server sent
+            :type favicon: Optional[str]
+            :returns: The favicon as a file named favicon.png, or None if the server has no favicon
+            :rtype: Optional[discord.File]
+        """
+
+        if favicon is None:
+            return None
+        if self.favicon is None or self.favicon[0] != favicon:
+            self.favicon = (favicon, base64.b64decode(favicon.split(",", 1)[-1]))
+        return discord.File(io.BytesIO(self.favicon[1]), filename="favicon.png")
+
+    async def _read_server_log(self, stream: asyncio.StreamReader) -> None:
+        """
+            Reads the server's output into server_log until it exits
+
+            If nothing reads the output the pipe fills up and the server blocks when it tries to log
+
+            :param stream: The server's output stream
+            :type stream: asyncio.StreamReader
+        """
+
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # The line was longer than the stream's buffer limit, it's been discarded
+                continue
+            if not line:
+                break
+            self.server_log.append(line.decode(errors="replace").rstrip())
 
     def _online(self) -> bool:
         """
@@ -123,9 +506,14 @@ class MCServerControl(commands.Cog, name="Minecraft"):
         """
 
         if self._online() is False:
-            self.server_proc = await asyncio.create_subprocess_shell(self.SERVER_EXEC_COMMAND,
-                                                                     stdout=subprocess.PIPE,
-                                                                     cwd=self.SERVER_WORKING_DIRECTORY)
+            self.server_proc = await asyncio.create_subprocess_exec(*self.SERVER_EXEC_ARGV,
+                                                                    stdout=subprocess.PIPE,
+                                                                    stderr=subprocess.STDOUT,
+                                                                    cwd=self.SERVER_WORKING_DIRECTORY,
+                                                                    start_new_session=True)
+            self.server_log.clear()
+            self.query_cache.clear()
+            self.log_reader = asyncio.create_task(self._read_server_log(self.server_proc.stdout))
             await ctx.send("Server starting up...")
         else:
             await ctx.send("Server already started!")
@@ -141,14 +529,24 @@ class MCServerControl(commands.Cog, name="Minecraft"):
 
         if self._online():
             await ctx.send("Stopping server...")
-            await self._execute_mc_command("stop")
-            await asyncio.sleep(self.SERVER_STOP_TIMEOUT)
             try:
-                await self.server_proc.kill()
+                await self._execute_mc_command("stop")
+            except RCONFailedError as error:
+                # The server may still be stopping (it closes rcon as it shuts down), so wait for it either way
+                await ctx.send(error.args[0])
+            try:
+                await asyncio.wait_for(self.server_proc.wait(), timeout=self.SERVER_STOP_TIMEOUT)
+            except asyncio.TimeoutError:
                 await ctx.send("Server took too long to stop, force killing...")
-            except ProcessLookupError:
-                pass
+                try:
+                    # The server was started as a session leader, so this also kills the java process start.sh runs
+                    os.killpg(self.server_proc.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                await self.server_proc.wait()
             await ctx.send('Server stopped')
+            self.query_cache.clear()
+            await self._close_rcon()
             self.server_proc = None
         else:
             await ctx.send("Server is not online")
@@ -163,20 +561,24 @@ class MCServerControl(commands.Cog, name="Minecraft"):
         """
 
         embed = discord.Embed()
+        favicon = None
         embed.title = "Server Status"
-        embed.add_field(name="Address", value=f"{self.PUBLIC_IP}:{self.SERVER_PORT}", inline=False)
+        embed.add_field(name="Address", value=self.public_address, inline=False)
         try:
-            stats = await self.query.async_status()
+            stats = await self._cached_status()
+        except self.QUERY_ERRORS:
+            embed.description = f"Server is offline, run `{self.bot.command_prefix}mc-start` to start it"
+            embed.colour = discord.Colour.red()
+        else:
             embed.description = "Server is online"
             embed.colour = discord.Colour.green()
             embed.add_field(name="Version", value=stats.version.name, inline=False)
             embed.add_field(name="Ping", value=str(stats.latency) + " ms", inline=False)
             embed.add_field(name="Players", value=f"{stats.players.online} out of {stats.players.max}", inline=False)
-            embed.set_thumbnail(url=f"https://eu.mc-api.net/v3/server/favicon/{self.PUBLIC_IP}:{self.SERVER_PORT}")
-        except ConnectionError or gaierror:
-            embed.description = f"Server is offline, run `{self.bot.command_prefix}mc-start` to start it"
-            embed.colour = discord.Colour.red()
-        await ctx.send(embed=embed)
+            favicon = self._favicon_file(stats.favicon)
+            if favicon is not None:
+                embed.set_thumbnail(url="attachment://favicon.png")
+        await ctx.send(embed=embed, file=favicon)
 
     @commands.command(name="mc-players", description="Get the players on the server right now")
     async def _players(self, ctx: commands.Context) -> None:
@@ -189,17 +591,41 @@ class MCServerControl(commands.Cog, name="Minecraft"):
 
         if self._online():
             try:
-                query = await self.query.async_query()
+                query = await self._cached_query()
                 names = '\n'.join(query.players.names)
                 if len(names) > 0:
                     await ctx.send(f"{query.players.online} out of {query.players.max} online,\n```\n{names}\n```")
                 else:
                     await ctx.send("No players online")
-            except ConnectionError or TimeoutError or gaierror:
+            except self.QUERY_ERRORS:
                 await ctx.send("Server refused query, is query enabled?")
         else:
             await ctx.send("Server is not online")
 
+    @commands.command(name="mc-log", description="Get the most recent output of the server")
+    async def _log(self, ctx: commands.Context) -> None:
+        """
+            This command sends the last lines the server printed, as many as fit in one message
+
+            :param ctx: The context surrounding the command evocation
+            :type ctx: commands.Context
+        """
+
+        lines = []
+        length = 0
+        for line in reversed(self.server_log):
+            length += len(line) + 1
+            if length > 1900:
+                if len(lines) == 0:
+                    lines.append(line[-1900:])
+                break
+            lines.append(line)
+        if len(lines) > 0:
+            log = '\n'.join(reversed(lines))
+            await ctx.send(f"```\n{log}\n```")
+        else:
+            await ctx.send("The server hasn't printed anything")
+
     @commands.command(name="mc-join", description="Get the IP to join the server")
     async def _join(self, ctx: commands.Context) -> None:
         """
@@ -209,8 +635,40 @@ class MCServerControl(commands.Cog, name="Minecraft"):
             :type ctx: commands.Context
         """
 
-        await ctx.send(
-            f"The server can be joined by typing `{self.PUBLIC_IP}:{self.SERVER_PORT}` as the server address")
+        await ctx.send(self.join_message)
+
+    async def _close_rcon(self) -> None:
+        """
+            Closes the rcon connection once any commands queued before this call have been sent
+        """
+
+        if self.rcon_worker is None or self.rcon_worker.done():
+            # Only the worker uses the connection, so with no worker it can be closed right away
+            self._stop_rcon()
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self.rcon_queue.put_nowait((None, future))
+            await future
+
+    async def _execute_mc_commands(self, *to_execute: str) -> list:
+        """
+            This function executes several commands on the minecraft server via rcon, in order, over one connection
+
+            :param to_execute: The commands to execute
+            :type to_execute: str
+            :returns: What the server says in response to each command
+            :rtype: list[str]
+        """
+
+        if self.rcon_worker is None or self.rcon_worker.done():
+            self.rcon_worker = asyncio.create_task(self._run_rcon_worker())
+        loop = asyncio.get_running_loop()
+        futures = []
+        for command in to_execute:
+            future = loop.create_future()
+            self.rcon_queue.put_nowait((command, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
 
     async def _execute_mc_command(self, command: str) -> str:
         """
@@ -222,27 +680,25 @@ class MCServerControl(commands.Cog, name="Minecraft"):
             :rtype: str
         """
 
-        await self._init_rcon()
-        response = self.rcon.command(command)
-        await self._stop_rcon()
-        return response
+        responses = await self._execute_mc_commands(command)
+        return responses[0]
 
     @commands.command(name="mc-exec", description="Execute a command on the server")
-    async def _exec(self, ctx: commands.Context, *command: str) -> None:
+    async def _exec(self, ctx: commands.Context, *, command: str = "") -> None:
         """
             This command executes a command on the minecraft server
 
             :param ctx: The context surrounding the command evocation
             :type ctx: commands.Context
-            :param command: The command to execute
-            :type command: list[str]
+            :param command: The command to execute, the rest of the message after mc-exec
+            :type command: str
         """
 
         if self._online():
-            to_exec = ' '.join(command)
-            if to_exec.strip() == "stop":
+            to_exec = command.strip()
+            if to_exec == "stop":
                 await ctx.send("Please use mc-stop to stop the server")
-            elif to_exec.strip() == "":
+            elif to_exec == "":
                 await ctx.send("Please type a command to exsecute")
             else:
                 try: